@@ -2,36 +2,49 @@
 Test configuration and fixtures for the FastAPI application tests.
 """
 
+import copy
 import pytest
+import src.app as app_module
 from fastapi.testclient import TestClient
 from src.app import app, activities
 
 
-@pytest.fixture
+# Pristine activity data, captured once at import before any test mutates it
+_BASELINE_ACTIVITIES = copy.deepcopy(activities)
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+    """Create a single test client for the FastAPI app, shared by the session."""
+    # Entering the client keeps one event loop portal open for every request
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
-def reset_activities():
-    """Reset activities to initial state after each test."""
-    # Store original state
-    original_activities = {
-        activity_name: {
-            "description": details["description"],
-            "schedule": details["schedule"], 
-            "max_participants": details["max_participants"],
-            "participants": details["participants"].copy()
-        }
-        for activity_name, details in activities.items()
+def reset_activities(monkeypatch):
+    """Give each test its own copy of the activities, undone after the test."""
+    monkeypatch.setattr(app_module, "activities", copy.deepcopy(_BASELINE_ACTIVITIES))
+
+
+@pytest.fixture
+def bulk_signup(reset_activities):
+    """Return a helper that adds participants directly, bypassing the API."""
+    def _bulk_signup(activity, emails):
+        app_module.activities[activity]["participants"].extend(emails)
+    return _bulk_signup
+
+
+@pytest.fixture
+def small_activity(reset_activities):
+    """Add a throwaway activity with three participants and return its name."""
+    app_module.activities["__test__"] = {
+        "description": "Throwaway activity for testing",
+        "schedule": "Test schedule",
+        "max_participants": 3,
+        "participants": ["a@mergington.edu", "b@mergington.edu", "c@mergington.edu"]
     }
-    
-    yield
-    
-    # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
+    return "__test__"
 
 
 @pytest.fixture
@@ -3,7 +3,9 @@ Tests for the FastAPI endpoints of the High School Management System.
 """
 
 import pytest
+import urllib.parse
 from fastapi import status
+import src.app as app_module
 
 
 class TestRootEndpoint:
@@ -13,8 +15,10 @@ class TestRootEndpoint:
         """Test that root endpoint redirects to static/index.html."""
         response = client.get("/")
         assert response.status_code == status.HTTP_200_OK
-        # Since it's a redirect, we should check the response contains the HTML
-        assert "Mergington High School" in response.text
+        # Since it's a redirect, we should check the response is the index HTML
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.content.startswith(b"<!DOCTYPE html>")
+        assert b"Mergington High School" in response.content[:512]
 
 
 class TestActivitiesEndpoint:
@@ -29,21 +33,18 @@ class TestActivitiesEndpoint:
         assert isinstance(data, dict)
         
         # Check that we have the expected activities
-        expected_activities = [
+        expected_activities = {
             "Chess Club", "Programming Class", "Gym Class", 
             "Basketball Team", "Track and Field", "Art Club",
             "Drama Club", "Debate Team", "Science Olympiad"
-        ]
-        
-        for activity in expected_activities:
-            assert activity in data
+        }
+        missing = expected_activities - data.keys()
+        assert not missing, f"Missing activities: {missing}"
             
         # Check structure of activity data
+        required_fields = {"description", "schedule", "max_participants", "participants"}
         for activity_name, details in data.items():
-            assert "description" in details
-            assert "schedule" in details
-            assert "max_participants" in details
-            assert "participants" in details
+            assert required_fields <= details.keys(), f"Activity '{activity_name}' missing fields"
             assert isinstance(details["participants"], list)
             assert isinstance(details["max_participants"], int)
     
@@ -74,9 +75,7 @@ class TestSignupEndpoint:
         assert data["message"] == f"Signed up {email} for {activity}"
         
         # Verify the participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        assert email in app_module.activities[activity]["participants"]
     
     def test_signup_for_nonexistent_activity(self, client):
         """Test signup for an activity that doesn't exist."""
@@ -100,13 +99,12 @@ class TestSignupEndpoint:
         data = response.json()
         assert data["detail"] == "Student already signed up for this activity"
     
-    def test_signup_with_special_characters_in_activity_name(self, client):
+    def test_signup_with_special_characters_in_activity_name(self, client, reset_activities):
         """Test signup with URL encoding for activity names."""
         email = "student@mergington.edu"
         activity = "Track and Field"  # Contains space
         
         # URL encode the activity name
-        import urllib.parse
         encoded_activity = urllib.parse.quote(activity)
         
         response = client.post(f"/activities/{encoded_activity}/signup?email={email}")
@@ -128,9 +126,7 @@ class TestRemoveParticipantEndpoint:
         assert data["message"] == f"Removed {email} from {activity}"
         
         # Verify the participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in app_module.activities[activity]["participants"]
     
     def test_remove_participant_from_nonexistent_activity(self, client):
         """Test removing participant from activity that doesn't exist."""
@@ -159,7 +155,6 @@ class TestRemoveParticipantEndpoint:
         email = "david@mergington.edu"  # Existing participant in Track and Field
         activity = "Track and Field"  # Contains space
         
-        import urllib.parse
         encoded_activity = urllib.parse.quote(activity)
         encoded_email = urllib.parse.quote(email)
         
@@ -180,35 +175,30 @@ class TestIntegrationScenarios:
         assert signup_response.status_code == status.HTTP_200_OK
         
         # Verify signup
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        assert email in app_module.activities[activity]["participants"]
         
         # Then remove
         remove_response = client.delete(f"/activities/{activity}/participants/{email}")
         assert remove_response.status_code == status.HTTP_200_OK
         
         # Verify removal
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in app_module.activities[activity]["participants"]
     
-    def test_activity_capacity_management(self, client, reset_activities):
+    def test_activity_capacity_management(self, client, bulk_signup):
         """Test that activity capacity is properly managed."""
         activity = "Chess Club"  # Has max_participants: 12
         
         # Get current participants count
-        activities_response = client.get("/activities")
-        current_count = len(activities_response.json()[activity]["participants"])
-        max_participants = activities_response.json()[activity]["max_participants"]
-        
-        # Add participants up to capacity
-        for i in range(max_participants - current_count):
-            email = f"student{i}@mergington.edu"
-            response = client.post(f"/activities/{activity}/signup?email={email}")
-            assert response.status_code == status.HTTP_200_OK
+        current_count = len(app_module.activities[activity]["participants"])
+        max_participants = app_module.activities[activity]["max_participants"]
+        
+        # Fill all but one spot directly, then take the last spot through the API
+        open_spots = max_participants - current_count
+        assert open_spots > 0, f"'{activity}' has no open spots to fill"
+        bulk_signup(activity, [f"student{i}@mergington.edu" for i in range(open_spots - 1)])
+        response = client.post(f"/activities/{activity}/signup?email=student{open_spots - 1}@mergington.edu")
+        assert response.status_code == status.HTTP_200_OK
         
         # Verify we're at capacity
-        activities_response = client.get("/activities")
-        final_count = len(activities_response.json()[activity]["participants"])
+        final_count = len(app_module.activities[activity]["participants"])
         assert final_count == max_participants
\ No newline at end of file
@@ -2,33 +2,35 @@
 Performance and edge case tests for the FastAPI application.
 """
 
+import asyncio
+import httpx
 import pytest
-from concurrent.futures import ThreadPoolExecutor
-import time
+import urllib.parse
+import src.app as app_module
+from src.app import app
 
 
 class TestPerformance:
     """Performance tests for the API endpoints."""
     
-    def test_get_activities_response_time(self, client):
+    def test_get_activities_response_time(self, client, benchmark):
         """Test that GET /activities responds quickly."""
-        start_time = time.time()
-        response = client.get("/activities")
-        end_time = time.time()
-        
-        response_time = end_time - start_time
+        response = benchmark.pedantic(client.get, args=("/activities",), rounds=50)
         assert response.status_code == 200
-        assert response_time < 1.0, f"Response time too slow: {response_time}s"
+        # Benchmarking is switched off under pytest-xdist, so only check timings when it ran
+        if benchmark.enabled:
+            mean_time = benchmark.stats.stats.mean
+            assert mean_time < 0.1, f"Mean response time too slow: {mean_time}s"
     
-    def test_multiple_concurrent_requests(self, client):
+    @pytest.mark.asyncio
+    async def test_multiple_concurrent_requests(self):
         """Test handling multiple concurrent requests."""
-        def make_request():
-            return client.get("/activities")
-        
-        # Make 10 concurrent requests
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(make_request) for _ in range(10)]
-            responses = [future.result() for future in futures]
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            # Make 10 concurrent requests on the event loop
+            responses = await asyncio.gather(
+                *[async_client.get("/activities") for _ in range(10)]
+            )
         
         # All requests should succeed
         for response in responses:
@@ -49,14 +51,13 @@ class TestEdgeCases:
         response = client.post(f"/activities/{activity}/signup?email={email}")
         assert response.status_code == 200
     
-    def test_activity_name_with_special_characters(self, client):
+    def test_activity_name_with_special_characters(self, client, reset_activities):
         """Test handling of activity names with special characters."""
         # "Track and Field" contains spaces
         activity = "Track and Field"
         email = "test@mergington.edu"
         
         # URL encode the activity name properly
-        import urllib.parse
         encoded_activity = urllib.parse.quote(activity)
         
         response = client.post(f"/activities/{encoded_activity}/signup?email={email}")
@@ -83,23 +84,20 @@ class TestEdgeCases:
 class TestBoundaryConditions:
     """Tests for boundary conditions and limits."""
     
-    def test_activity_at_capacity_boundary(self, client, reset_activities):
+    def test_activity_at_capacity_boundary(self, client, bulk_signup):
         """Test behavior when activity is at or near capacity."""
         # Find an activity with available spots
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
-        for activity_name, details in activities_data.items():
+        for activity_name, details in app_module.activities.items():
             current_count = len(details["participants"])
             max_count = details["max_participants"]
             
             if current_count < max_count:
-                # Fill remaining spots
+                # Fill remaining spots directly; only the overflow goes through the API
                 spots_to_fill = max_count - current_count
-                for i in range(spots_to_fill):
-                    email = f"boundary_test_{i}@mergington.edu"
-                    response = client.post(f"/activities/{activity_name}/signup?email={email}")
-                    assert response.status_code == 200
+                bulk_signup(
+                    activity_name,
+                    [f"boundary_test_{i}@mergington.edu" for i in range(spots_to_fill)]
+                )
                 
                 # Try to add one more (should work since we're not enforcing capacity in the API)
                 overflow_email = "overflow@mergington.edu"
@@ -108,74 +106,58 @@ class TestBoundaryConditions:
                 assert response.status_code == 200
                 break
     
-    def test_remove_last_participant(self, client, reset_activities):
+    def test_remove_last_participant(self, client, small_activity):
         """Test removing the last participant from an activity."""
-        # Find an activity with exactly one participant or create one
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
+        participants = app_module.activities[small_activity]["participants"]
         
-        for activity_name, details in activities_data.items():
-            if len(details["participants"]) >= 1:
-                # Remove all but one participant
-                participants = details["participants"].copy()
-                for email in participants[:-1]:
-                    response = client.delete(f"/activities/{activity_name}/participants/{email}")
-                    assert response.status_code == 200
-                
-                # Remove the last participant
-                last_email = participants[-1]
-                response = client.delete(f"/activities/{activity_name}/participants/{last_email}")
-                assert response.status_code == 200
-                
-                # Verify the activity has no participants
-                final_response = client.get("/activities")
-                final_data = final_response.json()
-                assert len(final_data[activity_name]["participants"]) == 0
-                break
+        # Remove all but one participant directly
+        del participants[:-1]
+        
+        # Remove the last participant through the API
+        last_email = participants[0]
+        response = client.delete(f"/activities/{small_activity}/participants/{last_email}")
+        assert response.status_code == 200
+        
+        # Verify the activity has no participants
+        assert len(app_module.activities[small_activity]["participants"]) == 0
 
 
 class TestErrorHandling:
     """Tests for error handling and recovery."""
     
-    def test_malformed_email_in_signup(self, client):
+    @pytest.mark.parametrize("email", [
+        "notanemail",
+        "@mergington.edu",
+        "test@",
+        "test@@mergington.edu",
+        "",
+        "test@wrongdomain.com"
+    ])
+    def test_malformed_email_in_signup(self, client, reset_activities, email):
         """Test signup with malformed email addresses."""
-        malformed_emails = [
-            "notanemail",
-            "@mergington.edu",
-            "test@",
-            "test@@mergington.edu",
-            "",
-            "test@wrongdomain.com"
-        ]
-        
-        for email in malformed_emails:
-            response = client.post(f"/activities/Chess Club/signup?email={email}")
-            # The API currently doesn't validate email format, so these will succeed
-            # In a real application, you might want to add validation
-            assert response.status_code in [200, 400, 422]
+        response = client.post(f"/activities/Chess Club/signup?email={email}")
+        # The API currently doesn't validate email format, so these will succeed
+        # In a real application, you might want to add validation
+        assert response.status_code in [200, 400, 422]
     
-    def test_sql_injection_attempt_in_email(self, client):
+    @pytest.mark.parametrize("email", [
+        "'; DROP TABLE users; --@mergington.edu",
+        "1' OR '1'='1@mergington.edu",
+        "<script>alert('xss')</script>@mergington.edu"
+    ])
+    def test_sql_injection_attempt_in_email(self, client, reset_activities, email):
         """Test that SQL injection attempts in email are handled safely."""
         # Since we're using in-memory data structures, this is more about input sanitization
-        malicious_emails = [
-            "'; DROP TABLE users; --@mergington.edu",
-            "1' OR '1'='1@mergington.edu",
-            "<script>alert('xss')</script>@mergington.edu"
-        ]
-        
-        for email in malicious_emails:
-            response = client.post(f"/activities/Chess Club/signup?email={email}")
-            # Should handle gracefully without crashing
-            assert response.status_code in [200, 400, 422]
+        response = client.post(f"/activities/Chess Club/signup?email={email}")
+        # Should handle gracefully without crashing
+        assert response.status_code in [200, 400, 422]
     
-    def test_unicode_characters_in_inputs(self, client):
+    @pytest.mark.parametrize("email", [
+        "tëst@mergington.edu",
+        "用户@mergington.edu",
+        "тест@mergington.edu"
+    ])
+    def test_unicode_characters_in_inputs(self, client, reset_activities, email):
         """Test handling of Unicode characters in inputs."""
-        unicode_emails = [
-            "tëst@mergington.edu",
-            "用户@mergington.edu",
-            "тест@mergington.edu"
-        ]
-        
-        for email in unicode_emails:
-            response = client.post(f"/activities/Chess Club/signup?email={email}")
-            assert response.status_code in [200, 400, 422]
\ No newline at end of file
+        response = client.post(f"/activities/Chess Club/signup?email={email}")
+        assert response.status_code in [200, 400, 422]